@@ -1,9 +1,15 @@
 import streamlit as st
 from supabase import create_client, Client
-from datetime import datetime, date
-from urllib.parse import unquote
+from datetime import datetime, date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import os
+import contextvars
+import time
+import html
+import uuid
 import base64
+import httpx
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -16,7 +22,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+APP_CSS = """
     <style>
     /* Main text color and shadow for better contrast */
     h1, h2, h3, h4, h5, h6, .stMarkdown, .stMetricLabel, .stMetricValue, p {
@@ -24,8 +30,8 @@ st.markdown("""
         text-shadow: 2px 2px 4px rgba(0,0,0,0.8);
     }
     
-    /* Dark Glassmorphism for Job Cards using :has() selector */
-    div[data-testid="stVerticalBlock"]:has(div.job-card-marker) {
+    /* Dark Glassmorphism for Job Cards - keyed containers get an st-key-job_card_<id> class */
+    div[class*="st-key-job_card_"] {
         background-color: rgba(15, 23, 42, 0.8);
         border: 1px solid rgba(255, 255, 255, 0.1);
         border-radius: 10px;
@@ -78,6 +84,21 @@ st.markdown("""
         color: #dddddd;
         margin-bottom: 0.5rem;
     }
+
+    .job-date {
+        font-size: 0.85rem;
+        color: rgba(255,255,255,0.6) !important;
+        text-shadow: none !important;
+    }
+
+    /* Read-only card fields, rendered as one HTML block per card */
+    .job-card-info {
+        display: flex;
+        gap: 1rem;
+    }
+    .job-card-info > div {
+        flex: 1;
+    }
     
     /* Styles for buttons to popup on dark background */
     .stButton>button {
@@ -134,31 +155,34 @@ st.markdown("""
         background: rgba(0,0,0,0);
     }
     </style>
-""", unsafe_allow_html=True)
+"""
 
-@st.cache_data
-def get_base64_video(video_path):
+@st.cache_resource
+def get_background_video_html(video_path):
+    """Encode the video and build its markup once per process (cache_resource skips the per-rerun copy)"""
     with open(video_path, "rb") as f:
-        data = f.read()
-    return base64.b64encode(data).decode()
-
-def set_background_video():
-    video_path = "background.mp4"
-    if os.path.exists(video_path):
-        video_base64 = get_base64_video(video_path)
-        video_html = f"""
+        video_base64 = base64.b64encode(f.read()).decode()
+    return f"""
         <video autoplay muted loop id="myVideo">
             <source src="data:video/mp4;base64,{video_base64}" type="video/mp4">
         </video>
         <div id="videoOverlay"></div>
         """
-        st.markdown(video_html, unsafe_allow_html=True)
+
+def render_page_chrome():
+    """Emit the custom CSS and background video as a single markdown element"""
+    # Runs on every rerun on purpose: Streamlit drops any element a rerun doesn't emit again,
+    # so gating this on st.session_state would lose the styling after the first interaction
+    video_path = "background.mp4"
+    if os.path.exists(video_path):
+        st.markdown(APP_CSS + get_background_video_html(video_path), unsafe_allow_html=True)
     else:
+        st.markdown(APP_CSS, unsafe_allow_html=True)
         st.warning("⚠️ Background video not found. Please ensure 'background.mp4' is in the project directory.")
 
-set_background_video()
+render_page_chrome()
 
-# Initialize Supabase Client
+# Initialize Supabase Client - cache_resource keeps one client per process, shared by every rerun and session
 @st.cache_resource
 def init_supabase():
     """Initialize Supabase client with credentials from environment or secrets"""
@@ -200,9 +224,16 @@ def init_supabase():
 
 supabase: Client = init_supabase()
 
-# Status options - MUST match the database constraint exactly (case-sensitive)
+# Shared handles - they only hold the session and path; every query chain below builds a fresh request from them
+JOBS_TABLE = supabase.table("job_applications")
+RESUMES_BUCKET = supabase.storage.from_("resumes")
+
+# Status options - MUST match the app_status enum in the database exactly (case-sensitive)
 STATUS_OPTIONS = ["Applied", "Accepted", "Withdrawn", "Rejected"]
 
+# Position of each status in STATUS_OPTIONS, for O(1) selectbox index / category code lookups
+STATUS_INDEX = {s: i for i, s in enumerate(STATUS_OPTIONS)}
+
 # Status color map for charts
 STATUS_COLORS = {
     "Applied":   "#60a5fa",
@@ -211,44 +242,276 @@ STATUS_COLORS = {
     "Rejected":  "#f87171",
 }
 
+# Badge-prefixed status labels for tables
+STATUS_BADGE_LABELS = {
+    "Applied":   "🔵 Applied",
+    "Accepted":  "🟢 Accepted",
+    "Withdrawn": "🟡 Withdrawn",
+    "Rejected":  "🔴 Rejected",
+}
+
+# Columns the UI actually reads - keep fetches narrow instead of SELECT *
+APPLICATION_COLUMNS = "id,company_name,role,status,resume_path,applied_date"
+
+# How long cached reads live, in seconds. Writes from this app clear the cache immediately,
+# so the TTL only bounds how stale changes made elsewhere can get
+CACHE_TTL = 60
+
+# Number of application cards rendered per page on the tracker tab
+PAGE_SIZE = 20
+
+# Upper bound for the unpaginated full-list fetch (matches Supabase's default API max rows)
+MAX_FETCH_ROWS = 1000
+
+# Resume uploads are retried this many times before giving up
+UPLOAD_ATTEMPTS = 3
+
+# Delay before the first upload retry, in seconds; doubled on each further attempt
+UPLOAD_BACKOFF = 0.5
+
+# Cached figures kept per chart builder (least recently used are dropped first)
+FIG_CACHE_ENTRIES = 32
+
+# Cached dashboard DataFrames kept (one per distinct data set; every write or date window makes a new one)
+DF_CACHE_ENTRIES = 8
+
+# Lifetime of the signed resume links, in seconds (well above the fetch cache TTL)
+SIGNED_URL_EXPIRY = 3600
+
 # ── Helper Functions ──────────────────────────────────────────────────────────
 
+def run_concurrently(*calls):
+    """Run independent (func, *args) calls on worker threads and return their results in order"""
+    # Worker threads need the script run context, otherwise st.* calls inside them are dropped
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=len(calls), initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        # Each call also runs in a copy of the caller's contextvars, which hold the active container
+        # (sidebar, form, ...), so st.error and friends render where the caller is rather than in the main body
+        futures = [executor.submit(contextvars.copy_context().run, func, *args) for func, *args in calls]
+        return [future.result() for future in futures]
+
+@st.cache_resource
+def get_background_executor():
+    """Process-wide pool for fire-and-forget work that the UI shouldn't wait on"""
+    return ThreadPoolExecutor(max_workers=2)
+
+def remove_resume_file(resume_path):
+    """Best-effort removal of a resume from storage (a leftover file is harmless)"""
+    try:
+        RESUMES_BUCKET.remove([resume_path])
+    except Exception:
+        pass
+
+def _storage_status(e):
+    """HTTP status of a failed storage request (0 when unknown or not a storage error)"""
+    # storage3's StorageApiError carries it in .status, sometimes as a string like "409"
+    try:
+        return int(getattr(e, "status", 0) or 0)
+    except (TypeError, ValueError):
+        return 0
+
 def upload_resume_to_storage(uploaded_file, company_name):
-    """Upload resume to Supabase Storage and return public URL"""
+    """Upload resume to Supabase Storage and return its storage path (None on failure)"""
     try:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         file_name = uploaded_file.name
-        file_path = f"{company_name.replace(' ', '_')}_{timestamp}_{file_name}"
+        file_path = f"{company_name.replace(' ', '_')}_{uuid.uuid4().hex[:12]}_{file_name}"
         file_bytes = uploaded_file.getvalue()
-        response = supabase.storage.from_("resumes").upload(
-            path=file_path,
-            file=file_bytes,
-            file_options={"content-type": "application/pdf"}
-        )
-        public_url = supabase.storage.from_("resumes").get_public_url(file_path)
-        return public_url, file_path
+        file_options = {"content-type": "application/pdf", "cache-control": "3600"}
+        for attempt in range(UPLOAD_ATTEMPTS):
+            try:
+                RESUMES_BUCKET.upload(
+                    path=file_path,
+                    file=file_bytes,
+                    file_options=file_options
+                )
+                break
+            except Exception as e:
+                status = _storage_status(e)
+                if attempt and (status == 409 or getattr(e, "code", None) == "Duplicate"):
+                    # An earlier attempt landed but its response was lost; the path is unique to this upload
+                    break
+                # Only network errors and 5xx are worth retrying - RLS denials, 413s and bad keys won't change
+                transient = isinstance(e, httpx.TransportError) or status >= 500
+                if not transient or attempt == UPLOAD_ATTEMPTS - 1:
+                    raise
+                time.sleep(UPLOAD_BACKOFF * 2 ** attempt)
+        return file_path
     except Exception as e:
         st.error(f"Error uploading file: {str(e)}")
+        return None
+
+def _ilike_pattern(search):
+    """Build a quoted PostgREST ilike pattern, escaping LIKE wildcards and reserved characters"""
+    escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    escaped = escaped.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"%{escaped}%"'
+
+def _applications_query(search=None, count=None):
+    """Build the ordered applications query, optionally filtered by company/role server-side"""
+    query = JOBS_TABLE.select(APPLICATION_COLUMNS, count=count)
+    if search:
+        pattern = _ilike_pattern(search)
+        query = query.or_(f"company_name.ilike.{pattern},role.ilike.{pattern}")
+    return query.order("applied_date", desc=True)
+
+def _job_card_html(row, resume_url):
+    """Build the read-only part of a job card (company, date, role, resume link) as one HTML block"""
+    resume_link = ""
+    if resume_url:
+        resume_link = (
+            f'<a href="{html.escape(resume_url)}" target="_blank" rel="noopener noreferrer">📄 View Resume</a>'
+        )
+    return (
+        '<div class="job-card-info">'
+        f'<div><div class="job-header">🏢 {html.escape(row["company_name"])}</div>'
+        f'<div class="job-date">📅 {row["applied_date_fmt"]}</div></div>'
+        f'<div><div class="job-role">👔 {html.escape(row["role"])}</div>{resume_link}</div>'
+        '</div>'
+    )
+
+def _add_display_fields(rows):
+    """Precompute per-row display values once, inside the cached fetch, so rendering does no parsing"""
+    for row in rows:
+        row["applied_date_fmt"] = datetime.fromisoformat(row["applied_date"]).strftime("%b %d, %Y")
+        row["_company_lc"] = row["company_name"].lower()
+        row["_role_lc"] = row["role"].lower()
+    return rows
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _signed_resume_urls(paths):
+    """Sign a tuple of resume paths in one create_signed_urls call (errors propagate, so failures aren't cached)"""
+    signed = RESUMES_BUCKET.create_signed_urls(list(paths), SIGNED_URL_EXPIRY)
+    return {item["path"]: item.get("signedURL") or item.get("signedUrl") for item in signed}
+
+def _add_card_html(rows):
+    """Sign every resume path on the page, then build each card's HTML"""
+    paths = tuple(row["resume_path"] for row in rows if row.get("resume_path"))
+    signed_urls = {}
+    if paths:
+        try:
+            signed_urls = _signed_resume_urls(paths)
+        except Exception as e:
+            st.warning(f"Could not load resume links: {str(e)}")
+    for row in rows:
+        row["card_html"] = _job_card_html(row, signed_urls.get(row.get("resume_path")))
+    return rows
+
+def _filter_applications(rows, search):
+    """Client-side search fallback: case-insensitive match on company or role"""
+    if not rows:
+        return []
+    sq = search.lower()
+    lowered = pd.DataFrame(rows, columns=["_company_lc", "_role_lc"])
+    mask = (
+        lowered["_company_lc"].str.contains(sq, regex=False, na=False)
+        | lowered["_role_lc"].str.contains(sq, regex=False, na=False)
+    )
+    return [row for row, keep in zip(rows, mask.to_numpy()) if keep]
+
+# Cached reads let errors propagate: Streamlit does not cache a raised exception, so the next
+# rerun retries instead of serving an empty result for the whole TTL. The public wrappers report them
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _fetch_applications(start=None, end=None):
+    """Fetch job applications, optionally filtered by applied-date range (cached, cleared on every write)"""
+    query = _applications_query()
+    if start:
+        query = query.gte("applied_date", start.isoformat())
+    if end:
+        # applied_date holds full ISO timestamps, so include the whole end day
+        query = query.lt("applied_date", (end + timedelta(days=1)).isoformat())
+    response = query.range(0, MAX_FETCH_ROWS - 1).execute()
+    return _add_display_fields(response.data)
+
+def fetch_applications(start=None, end=None):
+    """Fetch job applications (empty list on failure)"""
+    try:
+        return _fetch_applications(start, end)
+    except Exception as e:
+        st.error(f"Error fetching applications: {str(e)}")
+        return []
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _fetch_application_page(page, search=None):
+    """Fetch one page of job applications and the total number of matching rows"""
+    offset = (page - 1) * PAGE_SIZE
+    try:
+        response = _applications_query(search, count="exact").range(offset, offset + PAGE_SIZE - 1).execute()
+        return _add_display_fields(response.data), response.count or 0
+    except Exception:
+        if not search:
+            raise
+        # Server-side search failed - filter the cached full list instead
+        matches = _filter_applications(_fetch_applications(), search)
+        return matches[offset:offset + PAGE_SIZE], len(matches)
+
+def fetch_application_page(page, search=None):
+    """Fetch one page of job applications, with card HTML, and the match count (empty page on failure)"""
+    try:
+        rows, count = _fetch_application_page(page, search)
+    except Exception as e:
+        st.error(f"Error fetching applications: {str(e)}")
+        return [], 0
+    # Signed outside the page cache, so a storage outage doesn't pin link-less cards for the whole TTL
+    return _add_card_html(rows), count
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _get_status_counts():
+    """Fetch application counts per status, aggregated in Postgres by the app_status_counts RPC"""
+    response = supabase.rpc("app_status_counts").execute()
+    return {row["status"]: row["n"] for row in response.data}
+
+def get_status_counts():
+    """Application counts per status (empty dict on failure)"""
+    try:
+        return _get_status_counts()
+    except Exception as e:
+        st.error(f"Error fetching status counts: {str(e)}")
+        return {}
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _get_date_bounds():
+    """Earliest and latest applied date, used as the dashboard's default range ((None, None) when empty)"""
+    oldest = JOBS_TABLE.select("applied_date").order("applied_date").limit(1).execute().data
+    newest = JOBS_TABLE.select("applied_date").order("applied_date", desc=True).limit(1).execute().data
+    if not oldest:
         return None, None
+    return (
+        datetime.fromisoformat(oldest[0]["applied_date"]).date(),
+        datetime.fromisoformat(newest[0]["applied_date"]).date(),
+    )
 
-def insert_job_application(company, role, status, resume_url, resume_path):
-    """Insert new job application into database"""
+def get_date_bounds():
+    """Dashboard default date range ((None, None) on failure)"""
     try:
-        if status not in STATUS_OPTIONS:
-            st.error(f"Invalid status '{status}'. Must be one of: {', '.join(STATUS_OPTIONS)}")
-            return False
-        data = {
-            "company_name": company,
-            "role": role,
-            "status": status,
-            "resume_url": resume_url,
-            "applied_date": datetime.now().isoformat()
-        }
-        supabase.table("job_applications").insert(data).execute()
-        return True
+        return _get_date_bounds()
+    except Exception as e:
+        st.error(f"Error fetching date range: {str(e)}")
+        return None, None
+
+def clear_application_cache():
+    """Invalidate cached reads after a write so the next rerun sees fresh data"""
+    _fetch_applications.clear()
+    _get_date_bounds.clear()
+    _fetch_application_page.clear()
+    _get_status_counts.clear()
+
+def insert_job_application(company, role, status, resume_path):
+    """Insert new job application via the add_application RPC and return its id (None on failure)"""
+    try:
+        # Status is validated by the app_status enum in Postgres, in the same round trip as the insert
+        response = supabase.rpc("add_application", {
+            "p_company_name": company,
+            "p_role": role,
+            "p_status": status,
+            "p_resume_path": resume_path,
+            "p_applied_date": datetime.now().isoformat()
+        }).execute()
+        clear_application_cache()
+        return response.data["id"]
     except Exception as e:
         error_msg = str(e).lower()
-        if "constraint" in error_msg or "check" in error_msg:
+        if "constraint" in error_msg or "check" in error_msg or "app_status" in error_msg:
             st.error(f"""
             ❌ **Database Constraint Error**
             
@@ -258,30 +521,40 @@ def insert_job_application(company, role, status, resume_url, resume_path):
             """)
         else:
             st.error(f"Error saving application: {str(e)}")
-        return False
+        return None
 
-def fetch_all_applications():
-    """Fetch all job applications from database"""
+def attach_resume(app_id, resume_path):
+    """Link an uploaded resume to an existing application"""
     try:
-        response = supabase.table("job_applications").select("*").order("applied_date", desc=True).execute()
-        return response.data
+        JOBS_TABLE.update(
+            {"resume_path": resume_path}
+        ).eq("id", app_id).execute()
+        clear_application_cache()
+        return True
     except Exception as e:
-        st.error(f"Error fetching applications: {str(e)}")
-        return []
+        st.error(f"Error linking resume: {str(e)}")
+        return False
 
-def update_application_status(app_id, new_status):
-    """Update job application status"""
+def update_application_statuses(pending_updates):
+    """Apply a batch of {app_id: new_status} changes with one UPDATE per target status"""
+    ids_by_status = {}
+    for app_id, new_status in pending_updates.items():
+        ids_by_status.setdefault(new_status, []).append(app_id)
     try:
-        if new_status not in STATUS_OPTIONS:
-            st.error(f"Invalid status '{new_status}'. Must be one of: {', '.join(STATUS_OPTIONS)}")
-            return False
-        supabase.table("job_applications").update(
-            {"status": new_status}
-        ).eq("id", app_id).execute()
+        for new_status in ids_by_status:
+            if new_status not in STATUS_OPTIONS:
+                st.error(f"Invalid status '{new_status}'. Must be one of: {', '.join(STATUS_OPTIONS)}")
+                return False
+        for new_status, app_ids in ids_by_status.items():
+            JOBS_TABLE.update(
+                {"status": new_status}
+            ).in_("id", app_ids).execute()
+        clear_application_cache()
         return True
     except Exception as e:
+        clear_application_cache()
         error_msg = str(e).lower()
-        if "constraint" in error_msg or "check" in error_msg:
+        if "constraint" in error_msg or "check" in error_msg or "app_status" in error_msg:
             st.error(f"""
             ❌ **Database Constraint Error**
             
@@ -292,22 +565,41 @@ def update_application_status(app_id, new_status):
             st.error(f"Error updating status: {str(e)}")
         return False
 
-def delete_application(app_id, resume_url):
-    """Delete application and associated resume file"""
+def delete_application(app_id):
+    """Delete application, then remove its resume file in the background"""
     try:
-        if resume_url:
-            file_path = unquote(resume_url.split("/resumes/")[-1]) if "/resumes/" in resume_url else None
-            if file_path:
-                try:
-                    supabase.storage.from_("resumes").remove([file_path])
-                except Exception as storage_error:
-                    st.warning(f"Could not delete resume file: {str(storage_error)}")
-        supabase.table("job_applications").delete().eq("id", app_id).execute()
+        # One RPC deletes the row and hands back its resume path
+        response = supabase.rpc("delete_application_cascade", {"p_app_id": app_id}).execute()
+        clear_application_cache()
+        resume_path = response.data
+        if resume_path:
+            get_background_executor().submit(remove_resume_file, resume_path)
         return True
     except Exception as e:
         st.error(f"Error deleting application: {str(e)}")
         return False
 
+# Widget callbacks run before the script reruns, so the rerun they trigger already sees the new state
+def queue_status_change(app_id, saved_status):
+    """Queue a status dropdown change; it is written with the rest of the batch on Save changes"""
+    new_status = st.session_state[f"status_{app_id}"]
+    pending_updates = st.session_state.setdefault("pending_updates", {})
+    if new_status != saved_status:
+        pending_updates[app_id] = new_status
+    else:
+        pending_updates.pop(app_id, None)
+
+def save_pending_updates():
+    """Write all queued status changes in one batch"""
+    pending_updates = st.session_state.get("pending_updates", {})
+    if update_application_statuses(pending_updates):
+        pending_updates.clear()
+        st.toast("Status updated!", icon="✅")
+
+def go_to_page():
+    """Copy the page selector into "page", which (unlike widget state) survives runs that never reach the widget"""
+    st.session_state["page"] = st.session_state["page_input"]
+
 # ── Dashboard Helpers ─────────────────────────────────────────────────────────
 
 PLOTLY_LAYOUT = dict(
@@ -318,14 +610,121 @@ PLOTLY_LAYOUT = dict(
     margin=dict(l=20, r=20, t=40, b=20),
 )
 
-def build_dashboard(df: pd.DataFrame):
+# Figure builders take plain tuples (cheap to hash) so reruns with unchanged data reuse the cached figure.
+# The key is the data itself, so writes need no eviction; max_entries bounds how many old figures are kept.
+# cache_resource hands back the figure itself: cache_data would unpickle a copy on every hit, which costs
+# about as much as rebuilding it. The figures are shared, so callers only pass them to st.plotly_chart
+
+@st.cache_resource(show_spinner=False, max_entries=FIG_CACHE_ENTRIES)
+def make_line_fig(months, rates):
+    """Acceptance rate per month as a filled line chart"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=months,
+        y=rates,
+        mode="lines+markers",
+        line=dict(color="#60a5fa", width=2.5),
+        marker=dict(size=8, color="#60a5fa", line=dict(color="white", width=1.5)),
+        fill="tozeroy",
+        fillcolor="rgba(96,165,250,0.15)",
+        name="Acceptance Rate",
+        hovertemplate="%{x}<br>Rate: %{y:.1f}%<extra></extra>"
+    ))
+    fig.update_layout(
+        **PLOTLY_LAYOUT,
+        xaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.08)"),
+        yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.08)",
+                   ticksuffix="%", range=[0, 105]),
+        height=320,
+    )
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=FIG_CACHE_ENTRIES)
+def make_pie_fig(statuses, counts):
+    """Status distribution as a donut chart"""
+    colors = [STATUS_COLORS.get(s, "#94a3b8") for s in statuses]
+    fig = go.Figure(go.Pie(
+        labels=statuses,
+        values=counts,
+        hole=0.4,
+        marker=dict(colors=colors, line=dict(color="rgba(0,0,0,0.3)", width=2)),
+        textinfo="percent+label",
+        hovertemplate="%{label}: %{value} applications<extra></extra>",
+    ))
+    fig.update_layout(
+        **PLOTLY_LAYOUT,
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
+        height=320,
+    )
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=FIG_CACHE_ENTRIES)
+def make_role_fig(roles, rates, labels):
+    """Acceptance rate per role as a horizontal bar chart, colored by rate band"""
+    bar_colors = [
+        "#34d399" if r > 50 else "#fbbf24" if r >= 25 else "#f87171"
+        for r in rates
+    ]
+    fig = go.Figure(go.Bar(
+        x=rates,
+        y=roles,
+        orientation="h",
+        marker_color=bar_colors,
+        text=labels,
+        textposition="outside",
+        hovertemplate="%{y}<br>Rate: %{x:.1f}%<extra></extra>",
+    ))
+    fig.update_layout(
+        **PLOTLY_LAYOUT,
+        xaxis=dict(ticksuffix="%", range=[0, 115],
+                   showgrid=True, gridcolor="rgba(255,255,255,0.08)"),
+        yaxis=dict(showgrid=False),
+        height=max(280, 50 * len(roles)),
+        bargap=0.3,
+    )
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=FIG_CACHE_ENTRIES)
+def make_company_fig(companies, counts):
+    """Applications per company as a horizontal bar chart"""
+    fig = go.Figure(go.Bar(
+        x=counts,
+        y=companies,
+        orientation="h",
+        marker_color="#60a5fa",
+        hovertemplate="%{y}: %{x} applications<extra></extra>",
+    ))
+    fig.update_layout(
+        **PLOTLY_LAYOUT,
+        xaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.08)", dtick=1),
+        yaxis=dict(showgrid=False),
+        height=max(280, 42 * len(companies)),
+        bargap=0.3,
+    )
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=DF_CACHE_ENTRIES)
+def applications_to_df(data_key, _applications):
+    """Build the dashboard DataFrame once per distinct data_key (a tuple of (id, status) pairs)"""
+    df = pd.DataFrame(_applications)
+    df["applied_date"] = pd.to_datetime(df["applied_date"])
+    # Fixed categories so status comparisons are integer code checks instead of string equality
+    df["status"] = pd.Categorical(df["status"], categories=STATUS_OPTIONS)
+    # Monthly key, extracted once here rather than on every groupby
+    df["_month"] = df["applied_date"].dt.to_period("M")
+    # 0/1 flag so the per-group "accepted" count is a plain vectorized sum
+    df["is_accepted"] = (df["status"].cat.codes == STATUS_INDEX["Accepted"]).astype("int8")
+    return df
+
+def build_dashboard(min_date: date, max_date: date):
     """Render all dashboard rows."""
 
     # ── Filters ───────────────────────────────────────────────────────────────
     st.markdown("### 🎛️ Filters")
     fcol1, fcol2, fcol3 = st.columns([2, 2, 1])
-    min_date = df["applied_date"].min().date() if not df.empty else date(2024, 1, 1)
-    max_date = df["applied_date"].max().date() if not df.empty else date.today()
+    min_date = min_date or date(2024, 1, 1)
+    max_date = max_date or date.today()
 
     with fcol1:
         start_date = st.date_input("From", value=min_date, key="dash_start")
@@ -337,20 +736,30 @@ def build_dashboard(df: pd.DataFrame):
             st.cache_data.clear()
             st.rerun()
 
-    # Apply date filter
-    mask = (df["applied_date"].dt.date >= start_date) & (df["applied_date"].dt.date <= end_date)
-    df = df[mask].copy()
-
-    if df.empty:
+    # Date filter runs in Postgres, so only the selected window is transferred
+    applications = fetch_applications(start=start_date, end=end_date)
+    if not applications:
         st.info("📭 No applications in the selected date range. Adjust the filter or add more applications!")
         return
+    if len(applications) == MAX_FETCH_ROWS:
+        st.warning(
+            f"⚠️ Showing the {MAX_FETCH_ROWS} most recent applications in this range - "
+            "narrow the dates to include older ones in these figures."
+        )
+
+    # Build a DataFrame - cached, keyed on the only fields that can change after insert
+    data_key = tuple((app["id"], app["status"]) for app in applications)
+    df = applications_to_df(data_key, applications)
+
+    # One counting pass, shared by the metric cards and the status pie
+    status_counts = df["status"].value_counts().reindex(STATUS_OPTIONS, fill_value=0)
 
     st.divider()
 
     # ── Row 1 – Key Metric Cards ──────────────────────────────────────────────
     total = len(df)
-    applied_count  = len(df[df["status"] == "Applied"])
-    accepted_count = len(df[df["status"] == "Accepted"])
+    applied_count  = int(status_counts["Applied"])
+    accepted_count = int(status_counts["Accepted"])
     acceptance_rate = (accepted_count / total * 100) if total else 0
 
     mc1, mc2, mc3, mc4 = st.columns(4)
@@ -372,104 +781,56 @@ def build_dashboard(df: pd.DataFrame):
 
     st.markdown("<br>", unsafe_allow_html=True)
 
+    # ── Chart data ───────────────────────────────────────────────────────────
+    grp = df.groupby("_month", as_index=False).agg(
+        total=("is_accepted", "size"),
+        accepted=("is_accepted", "sum"),
+    )
+    grp["rate"] = grp["accepted"] / grp["total"] * 100
+    grp["month_str"] = grp["_month"].dt.strftime("%b %Y")
+
+    present = status_counts[status_counts > 0]
+
+    role_grp = df.groupby("role", as_index=False).agg(
+        total=("is_accepted", "size"),
+        accepted=("is_accepted", "sum"),
+    )
+    role_grp["rate"] = role_grp["accepted"] / role_grp["total"] * 100
+    role_grp["label"] = (
+        role_grp["accepted"].astype(str) + " accepted / " + role_grp["total"].astype(str) + " total"
+    )
+    role_grp = role_grp.sort_values("rate", ascending=True)
+
+    # Unsorted counts + nlargest is a partial sort over the unique companies, not a full one
+    top_co = (
+        df["company_name"].value_counts(sort=False)
+        .nlargest(10)
+        .sort_values()
+        .rename_axis("company")
+        .reset_index(name="count")
+    )
+
+    # Built serially: figure construction is pure Python and holds the GIL, so threads don't speed it up
+    fig_line = make_line_fig(tuple(grp["month_str"].tolist()), tuple(grp["rate"].tolist()))
+    fig_pie = make_pie_fig(tuple(present.index.astype(str)), tuple(present.tolist()))
+    fig_role = make_role_fig(
+        tuple(role_grp["role"].tolist()), tuple(role_grp["rate"].tolist()), tuple(role_grp["label"].tolist())
+    )
+    fig_co = make_company_fig(tuple(top_co["company"].tolist()), tuple(top_co["count"].tolist()))
+
     # ── Row 2 – Acceptance Rate Over Time  +  Status Pie ─────────────────────
     rc2l, rc2r = st.columns(2)
 
     with rc2l:
         st.markdown("#### 📈 Acceptance Rate Over Time")
-        monthly = df.copy()
-        monthly["month"] = monthly["applied_date"].dt.to_period("M")
-        grp = monthly.groupby("month").apply(
-            lambda g: pd.Series({
-                "total": len(g),
-                "accepted": (g["status"] == "Accepted").sum()
-            })
-        ).reset_index()
-        grp["rate"] = grp["accepted"] / grp["total"] * 100
-        grp["month_str"] = grp["month"].dt.strftime("%b %Y")
-
-        if len(grp) >= 1:
-            fig_line = go.Figure()
-            fig_line.add_trace(go.Scatter(
-                x=grp["month_str"],
-                y=grp["rate"],
-                mode="lines+markers",
-                line=dict(color="#60a5fa", width=2.5),
-                marker=dict(size=8, color="#60a5fa", line=dict(color="white", width=1.5)),
-                fill="tozeroy",
-                fillcolor="rgba(96,165,250,0.15)",
-                name="Acceptance Rate",
-                hovertemplate="%{x}<br>Rate: %{y:.1f}%<extra></extra>"
-            ))
-            fig_line.update_layout(
-                **PLOTLY_LAYOUT,
-                xaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.08)"),
-                yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.08)",
-                           ticksuffix="%", range=[0, 105]),
-                height=320,
-            )
-            st.plotly_chart(fig_line, use_container_width=True)
-        else:
-            st.info("Add applications across multiple months to see the trend.")
+        st.plotly_chart(fig_line, use_container_width=True)
 
     with rc2r:
         st.markdown("#### 🍩 Status Distribution")
-        status_counts = df["status"].value_counts().reset_index()
-        status_counts.columns = ["status", "count"]
-        colors = [STATUS_COLORS.get(s, "#94a3b8") for s in status_counts["status"]]
-
-        fig_pie = go.Figure(go.Pie(
-            labels=status_counts["status"],
-            values=status_counts["count"],
-            hole=0.4,
-            marker=dict(colors=colors, line=dict(color="rgba(0,0,0,0.3)", width=2)),
-            textinfo="percent+label",
-            hovertemplate="%{label}: %{value} applications<extra></extra>",
-        ))
-        fig_pie.update_layout(
-            **PLOTLY_LAYOUT,
-            showlegend=True,
-            legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
-            height=320,
-        )
         st.plotly_chart(fig_pie, use_container_width=True)
 
     # ── Row 3 – Acceptance Rate by Role ──────────────────────────────────────
     st.markdown("#### 💼 Acceptance Rate by Role")
-    role_grp = df.groupby("role").apply(
-        lambda g: pd.Series({
-            "total": len(g),
-            "accepted": (g["status"] == "Accepted").sum()
-        })
-    ).reset_index()
-    role_grp["rate"] = role_grp["accepted"] / role_grp["total"] * 100
-    role_grp["label"] = role_grp.apply(
-        lambda r: f"{int(r['accepted'])} accepted / {int(r['total'])} total", axis=1
-    )
-    role_grp = role_grp.sort_values("rate", ascending=True)
-
-    bar_colors = [
-        "#34d399" if r > 50 else "#fbbf24" if r >= 25 else "#f87171"
-        for r in role_grp["rate"]
-    ]
-
-    fig_role = go.Figure(go.Bar(
-        x=role_grp["rate"],
-        y=role_grp["role"],
-        orientation="h",
-        marker_color=bar_colors,
-        text=role_grp["label"],
-        textposition="outside",
-        hovertemplate="%{y}<br>Rate: %{x:.1f}%<extra></extra>",
-    ))
-    fig_role.update_layout(
-        **PLOTLY_LAYOUT,
-        xaxis=dict(ticksuffix="%", range=[0, 115],
-                   showgrid=True, gridcolor="rgba(255,255,255,0.08)"),
-        yaxis=dict(showgrid=False),
-        height=max(280, 50 * len(role_grp)),
-        bargap=0.3,
-    )
     st.plotly_chart(fig_role, use_container_width=True)
 
     # ── Row 4 – Top Companies  +  Recent Applications ────────────────────────
@@ -477,42 +838,16 @@ def build_dashboard(df: pd.DataFrame):
 
     with rb5l:
         st.markdown("#### 🏢 Top Companies")
-        top_co = (
-            df["company_name"].value_counts()
-            .head(10)
-            .reset_index()
-        )
-        top_co.columns = ["company", "count"]
-        top_co = top_co.sort_values("count", ascending=True)
-
-        fig_co = go.Figure(go.Bar(
-            x=top_co["count"],
-            y=top_co["company"],
-            orientation="h",
-            marker_color="#60a5fa",
-            hovertemplate="%{y}: %{x} applications<extra></extra>",
-        ))
-        fig_co.update_layout(
-            **PLOTLY_LAYOUT,
-            xaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.08)", dtick=1),
-            yaxis=dict(showgrid=False),
-            height=max(280, 42 * len(top_co)),
-            bargap=0.3,
-        )
         st.plotly_chart(fig_co, use_container_width=True)
 
     with rb5r:
         st.markdown("#### 🕐 Recent Applications")
         recent = df.sort_values("applied_date", ascending=False).head(5).copy()
-        recent["Date"] = recent["applied_date"].dt.strftime("%b %d, %Y")
+        # Formatted once per row in the cached fetch (_add_display_fields), same as the tracker cards
+        recent["Date"] = recent["applied_date_fmt"]
 
-        status_badge = {
-            "Applied":   "🔵",
-            "Accepted":  "🟢",
-            "Withdrawn": "🟡",
-            "Rejected":  "🔴",
-        }
-        recent["Status"] = recent["status"].apply(lambda s: f"{status_badge.get(s, '⚪')} {s}")
+        # status is categorical, so map() relabels the 4 categories rather than every row
+        recent["Status"] = recent["status"].map(STATUS_BADGE_LABELS)
 
         display = recent[["company_name", "role", "Status", "Date"]].copy()
         display.columns = ["Company", "Role", "Status", "Date"]
@@ -543,15 +878,26 @@ with st.sidebar:
                 st.error("⚠️ Company name and role are required!")
             else:
                 with st.spinner("Saving application..."):
-                    resume_url = None
-                    resume_path = None
                     if uploaded_file:
-                        resume_url, resume_path = upload_resume_to_storage(uploaded_file, company)
-                        if not resume_url:
+                        # Upload and insert are independent, so run them side by side and link afterwards
+                        resume_path, app_id = run_concurrently(
+                            (upload_resume_to_storage, uploaded_file, company),
+                            (insert_job_application, company, role, status, None),
+                        )
+                        if not resume_path:
+                            if app_id is not None:
+                                delete_application(app_id)
                             st.error("Failed to upload resume. Please try again.")
                             st.stop()
-                    success = insert_job_application(company, role, status, resume_url, resume_path)
-                    if success:
+                        if app_id is None:
+                            remove_resume_file(resume_path)
+                        elif not attach_resume(app_id, resume_path):
+                            delete_application(app_id)
+                            remove_resume_file(resume_path)
+                            app_id = None
+                    else:
+                        app_id = insert_job_application(company, role, status, None)
+                    if app_id is not None:
                         st.success("✅ Application saved successfully!")
                         st.rerun()
                     else:
@@ -565,38 +911,53 @@ with st.sidebar:
 st.title("JOB APPLICATION CONTAINER")
 st.markdown("Store all your applications in one place")
 
-# Fetch data once — shared between both tabs
-applications = fetch_all_applications()
+# Small aggregates shared by both tabs. The two reads are independent, so overlap them
+status_counts, (first_date, last_date) = run_concurrently(
+    (get_status_counts,),
+    (get_date_bounds,),
+)
+has_applications = sum(status_counts.values()) > 0
 
 tab1, tab2 = st.tabs(["📋 Application Tracker", "📊 Dashboard & Analytics"])
 
 # ── Tab 1: Application Tracker ────────────────────────────────────────────────
 with tab1:
-    if not applications:
+    if not has_applications:
         st.info("📝 No applications yet. Add your first application using the sidebar!")
     else:
-        search_query = st.text_input(
-            "🔍 Search Applications",
-            placeholder="Search by Company or Role..."
-        ).strip()
-
-        if search_query:
-            filtered_applications = [
-                app for app in applications
-                if search_query.lower() in app["company_name"].lower()
-                or search_query.lower() in app["role"].lower()
-            ]
-        else:
-            filtered_applications = applications
+        # Wrapped in a form so the search only runs on submit, not on every keystroke
+        with st.form("search_form"):
+            scol1, scol2 = st.columns([5, 1])
+            with scol1:
+                search_query = st.text_input(
+                    "🔍 Search Applications",
+                    placeholder="Search by Company or Role..."
+                ).strip()
+            with scol2:
+                st.markdown("<br>", unsafe_allow_html=True)
+                st.form_submit_button("Search", use_container_width=True)
+
+        # Start from the first page whenever the search changes
+        if st.session_state.get("last_search") != search_query:
+            st.session_state["last_search"] = search_query
+            st.session_state["page"] = 1
+        page = st.session_state.get("page", 1)
+
+        if not search_query:
+            page = min(page, max(1, -(-sum(status_counts.values()) // PAGE_SIZE)))
+
+        filtered_applications, total_matches = fetch_application_page(page, search_query or None)
+        total_pages = max(1, -(-total_matches // PAGE_SIZE))
+        if page > total_pages:
+            page = total_pages
+            filtered_applications, total_matches = fetch_application_page(page, search_query or None)
+        # Kept outside widget state: a Delete rerun ends the run before the page selector is drawn
+        st.session_state["page"] = page
 
         # Stats row
         col1, col2, col3, col4, col5 = st.columns(5)
-        status_counts = {}
-        for app in applications:
-            s = app.get("status", "Unknown")
-            status_counts[s] = status_counts.get(s, 0) + 1
 
-        with col1: st.metric("Total Applications", len(applications))
+        with col1: st.metric("Total Applications", sum(status_counts.values()))
         with col2: st.metric("Applied",    status_counts.get("Applied",    0))
         with col3: st.metric("Accepted",   status_counts.get("Accepted",   0))
         with col4: st.metric("Withdrawn",  status_counts.get("Withdrawn",  0))
@@ -605,59 +966,60 @@ with tab1:
         st.divider()
 
         if search_query:
-            st.subheader(f"Search Results ({len(filtered_applications)})")
+            st.subheader(f"Search Results ({total_matches})")
         else:
             st.subheader("All Applications")
+        if total_pages > 1:
+            st.caption(f"Page {page} of {total_pages}")
 
         if not filtered_applications and search_query:
             st.info("No applications found matching your search.")
 
+        pending_updates = st.session_state.setdefault("pending_updates", {})
+        if pending_updates:
+            st.button(
+                f"💾 Save changes ({len(pending_updates)})",
+                key="save_status_changes",
+                on_click=save_pending_updates
+            )
+
         for app in filtered_applications:
-            with st.container():
-                st.markdown('<div class="job-card-marker"></div>', unsafe_allow_html=True)
-                c1, c2, c3, c4 = st.columns([3, 3, 2, 2])
+            with st.container(key=f"job_card_{app['id']}"):
+                c1, c2, c3 = st.columns([6, 2, 2])
 
                 with c1:
-                    st.markdown(f"**🏢 {app['company_name']}**")
-                    st.caption(f"📅 {datetime.fromisoformat(app['applied_date']).strftime('%b %d, %Y')}")
+                    st.markdown(app["card_html"], unsafe_allow_html=True)
 
                 with c2:
-                    st.markdown(f"**👔 {app['role']}**")
-                    if app.get("resume_url"):
-                        st.markdown(
-                            f'<a href="{app["resume_url"]}" target="_blank" rel="noopener noreferrer">📄 View Resume</a>',
-                            unsafe_allow_html=True
-                        )
-
-                with c3:
-                    new_status = st.selectbox(
+                    shown_status = pending_updates.get(app["id"], app["status"])
+                    st.selectbox(
                         "Status",
                         STATUS_OPTIONS,
-                        index=STATUS_OPTIONS.index(app["status"]) if app["status"] in STATUS_OPTIONS else 0,
+                        index=STATUS_INDEX.get(shown_status, 0),
                         key=f"status_{app['id']}",
-                        label_visibility="collapsed"
+                        label_visibility="collapsed",
+                        on_change=queue_status_change,
+                        args=(app["id"], app["status"])
                     )
-                    if new_status != app["status"]:
-                        if update_application_status(app["id"], new_status):
-                            st.success("Status updated!")
-                            st.rerun()
 
-                with c4:
+                with c3:
                     if st.button("🗑️ Delete", key=f"delete_{app['id']}", use_container_width=True):
-                        if delete_application(app["id"], app.get("resume_url")):
+                        if delete_application(app["id"]):
+                            pending_updates.pop(app["id"], None)
                             st.success("Deleted!")
                             st.rerun()
 
+        if total_pages > 1:
+            st.session_state["page_input"] = page
+            st.number_input("Page", min_value=1, max_value=total_pages, step=1, key="page_input", on_change=go_to_page)
+
 # ── Tab 2: Dashboard & Analytics ─────────────────────────────────────────────
 with tab2:
-    if not applications:
+    if not has_applications:
         st.info("📭 No data yet. Add applications to see analytics!")
     else:
-        # Build a DataFrame
-        df = pd.DataFrame(applications)
-        df["applied_date"] = pd.to_datetime(df["applied_date"])
         with st.spinner("Building dashboard…"):
-            build_dashboard(df)
+            build_dashboard(first_date, last_date)
 
 
 # ── Footer ────────────────────────────────────────────────────────────────────